@@ -1,17 +1,49 @@
 import datetime
-import itertools
-import textwrap
+import functools
+import sys
 from io import BytesIO
+from typing import Dict
 from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
 from typing import SupportsInt
+from typing import Tuple
+from typing import Union
 
 from babel.lists import format_list as babel_list
 
 import discord
 
+_ERROR_PREFIX = sys.intern("\N{NO ENTRY SIGN} ")
+_WARNING_PREFIX = sys.intern("\N{WARNING SIGN}\N{VARIATION SELECTOR-16} ")
+_INFO_PREFIX = sys.intern("\N{INFORMATION SOURCE}\N{VARIATION SELECTOR-16} ")
+_QUESTION_PREFIX = sys.intern(
+    "\N{BLACK QUESTION MARK ORNAMENT}\N{VARIATION SELECTOR-16} "
+)
+
+_BOLD = sys.intern("**")
+_ITALICS = sys.intern("*")
+_STRIKETHROUGH = sys.intern("~~")
+_UNDERLINE = sys.intern("__")
+_QUOTE = sys.intern("> ")
+_CODE_FENCE = sys.intern("```")
+
+_escape_markdown = discord.utils.escape_markdown
+
+_PERIODS = (
+    ("year", "years", 60 * 60 * 24 * 365),
+    ("month", "months", 60 * 60 * 24 * 30),
+    ("day", "days", 60 * 60 * 24),
+    ("hour", "hours", 60 * 60),
+    ("minute", "minutes", 60),
+    ("second", "seconds", 1),
+)
+
+_PERM_NAME_CACHE: Dict[str, str] = {}
+
+_DEFAULT_DELIMS: Tuple[str, ...] = ("\n",)
+
 
 def error(text: str) -> str:
     """Get text prefixed with an error emoji.
@@ -22,7 +54,7 @@ def error(text: str) -> str:
         The new message.
 
     """
-    return "\N{NO ENTRY SIGN} {}".format(text)
+    return _ERROR_PREFIX + text
 
 
 def warning(text: str) -> str:
@@ -34,7 +66,7 @@ def warning(text: str) -> str:
         The new message.
 
     """
-    return "\N{WARNING SIGN}\N{VARIATION SELECTOR-16} {}".format(text)
+    return _WARNING_PREFIX + text
 
 
 def info(text: str) -> str:
@@ -46,7 +78,7 @@ def info(text: str) -> str:
         The new message.
 
     """
-    return "\N{INFORMATION SOURCE}\N{VARIATION SELECTOR-16} {}".format(text)
+    return _INFO_PREFIX + text
 
 
 def question(text: str) -> str:
@@ -58,7 +90,7 @@ def question(text: str) -> str:
         The new message.
 
     """
-    return "\N{BLACK QUESTION MARK ORNAMENT}\N{VARIATION SELECTOR-16} {}".format(text)
+    return _QUESTION_PREFIX + text
 
 
 def bold(text: str, escape_formatting: bool = True) -> str:
@@ -79,8 +111,9 @@ def bold(text: str, escape_formatting: bool = True) -> str:
         The marked up text.
 
     """
-    text = escape(text, formatting=escape_formatting)
-    return "**{}**".format(text)
+    if escape_formatting:
+        text = _escape_markdown(text)
+    return _BOLD + text + _BOLD
 
 
 def box(text: str, lang: str = "") -> str:
@@ -99,8 +132,7 @@ def box(text: str, lang: str = "") -> str:
         The marked up text.
 
     """
-    ret = "```{}\n{}\n```".format(lang, text)
-    return ret
+    return _CODE_FENCE + lang + "\n" + text + "\n" + _CODE_FENCE
 
 
 def inline(text: str) -> str:
@@ -117,10 +149,7 @@ def inline(text: str) -> str:
         The marked up text.
 
     """
-    if "`" in text:
-        return "``{}``".format(text)
-    else:
-        return "`{}`".format(text)
+    return f"``{text}``" if "`" in text else f"`{text}`"
 
 
 def italics(text: str, escape_formatting: bool = True) -> str:
@@ -141,8 +170,9 @@ def italics(text: str, escape_formatting: bool = True) -> str:
         The marked up text.
 
     """
-    text = escape(text, formatting=escape_formatting)
-    return "*{}*".format(text)
+    if escape_formatting:
+        text = _escape_markdown(text)
+    return _ITALICS + text + _ITALICS
 
 
 def bordered(*columns: Sequence[str], ascii_border: bool = False) -> str:
@@ -165,56 +195,72 @@ def bordered(*columns: Sequence[str], ascii_border: bool = False) -> str:
         The bordered text.
 
     """
-    borders = {
-        "TL": "+" if ascii_border else "┌",  # Top-left
-        "TR": "+" if ascii_border else "┐",  # Top-right
-        "BL": "+" if ascii_border else "└",  # Bottom-left
-        "BR": "+" if ascii_border else "┘",  # Bottom-right
-        "HZ": "-" if ascii_border else "─",  # Horizontal
-        "VT": "|" if ascii_border else "│",  # Vertical
-    }
+    tl = "+" if ascii_border else "┌"  # Top-left
+    tr = "+" if ascii_border else "┐"  # Top-right
+    bl = "+" if ascii_border else "└"  # Bottom-left
+    br = "+" if ascii_border else "┘"  # Bottom-right
+    hz = "-" if ascii_border else "─"  # Horizontal
+    vt = "|" if ascii_border else "│"  # Vertical
 
     sep = " " * 4  # Separator between boxes
     widths = tuple(
         max(len(row) for row in column) + 9 for column in columns
     )  # width of each col
+    # every border and blank cell only depends on its column's width
+    top_line = sep.join(tl + hz * width + tr for width in widths)
+    bottom_borders = tuple(bl + hz * width + br for width in widths)
+    empty_cells = tuple(" " * (width + 2) for width in widths)
     colsdone = [False] * len(columns)  # whether or not each column is done
-    lines = [sep.join("{TL}" + "{HZ}" * width + "{TR}" for width in widths)]
+    lines = [top_line]
+
+    # pad shorter columns with None so rows can be walked with a plain zip
+    max_rows = max((len(column) for column in columns), default=0)
+    padded = [list(column) + [None] * (max_rows - len(column)) for column in columns]
 
-    for line in itertools.zip_longest(*columns):
+    for line in zip(*padded):
         row = []
         for colidx, column in enumerate(line):
-            width = widths[colidx]
-            done = colsdone[colidx]
             if column is None:
-                if not done:
+                if not colsdone[colidx]:
                     # bottom border of column
-                    column = "{HZ}" * width
-                    row.append("{BL}" + column + "{BR}")
+                    row.append(bottom_borders[colidx])
                     colsdone[colidx] = True  # mark column as done
                 else:
                     # leave empty
-                    row.append(" " * (width + 2))
+                    row.append(empty_cells[colidx])
             else:
-                column += " " * (width - len(column))  # append padded spaces
-                row.append("{VT}" + column + "{VT}")
+                row.append(vt + column.ljust(widths[colidx]) + vt)
 
         lines.append(sep.join(row))
 
-    final_row = []
-    for width, done in zip(widths, colsdone):
-        if not done:
-            final_row.append("{BL}" + "{HZ}" * width + "{BR}")
-        else:
-            final_row.append(" " * (width + 2))
-    lines.append(sep.join(final_row))
+    lines.append(
+        sep.join(
+            empty_cells[colidx] if done else bottom_borders[colidx]
+            for colidx, done in enumerate(colsdone)
+        )
+    )
 
-    return "\n".join(lines).format(**borders)
+    return "\n".join(lines)
+
+
+def _next_break(
+    text: str, start: int, page_length: int, delims: Tuple[str, ...], priority: bool
+) -> int:
+    """Get the length of the page starting at ``start``, as split by `pagify`."""
+    rfind = text.rfind
+    closest_delim = -1
+    for d in delims:
+        pos = rfind(d, start + 1, start + page_length)
+        if pos > closest_delim:
+            closest_delim = pos
+            if priority:
+                break
+    return closest_delim - start if closest_delim != -1 else page_length
 
 
 def pagify(
     text: str,
-    delims: Sequence[str] = ["\n"],  # noqa B006
+    delims: Sequence[str] = _DEFAULT_DELIMS,
     *,
     priority: bool = False,
     escape_mass_mentions: bool = True,
@@ -256,33 +302,23 @@ def pagify(
         Pages of the given text.
 
     """
-    in_text = text
+    # escaping up front means page lengths already include the added characters
+    in_text = escape(text, mass_mentions=True) if escape_mass_mentions else text
     page_length -= shorten_by
-    while len(in_text) > page_length:
-        this_page_len = page_length
-        if escape_mass_mentions:
-            this_page_len -= in_text.count("@here", 0, page_length) + in_text.count(
-                "@everyone", 0, page_length
-            )
-        _closest_delim = (in_text.rfind(d, 1, this_page_len) for d in delims)
-        if priority:
-            closest_delim = next((x for x in _closest_delim if x > 0), -1)
-        else:
-            closest_delim = max(_closest_delim)
-        closest_delim = closest_delim if closest_delim != -1 else this_page_len
-        if escape_mass_mentions:
-            to_send = escape(in_text[:closest_delim], mass_mentions=True)
-        else:
-            to_send = in_text[:closest_delim]
-        if len(to_send.strip()) > 0:
+    if not isinstance(delims, tuple):
+        delims = tuple(delims)
+    cursor = 0
+    end = len(in_text)
+    while end - cursor > page_length:
+        closest_delim = _next_break(in_text, cursor, page_length, delims, priority)
+        to_send = in_text[cursor:cursor + closest_delim]
+        if to_send and not to_send.isspace():
             yield to_send
-        in_text = in_text[closest_delim:]
+        cursor += closest_delim
 
-    if len(in_text.strip()) > 0:
-        if escape_mass_mentions:
-            yield escape(in_text, mass_mentions=True)
-        else:
-            yield in_text
+    in_text = in_text[cursor:]
+    if in_text and not in_text.isspace():
+        yield in_text
 
 
 def strikethrough(text: str, escape_formatting: bool = True) -> str:
@@ -304,8 +340,9 @@ def strikethrough(text: str, escape_formatting: bool = True) -> str:
         The marked up text.
 
     """
-    text = escape(text, formatting=escape_formatting)
-    return "~~{}~~".format(text)
+    if escape_formatting:
+        text = _escape_markdown(text)
+    return _STRIKETHROUGH + text + _STRIKETHROUGH
 
 
 def underline(text: str, escape_formatting: bool = True) -> str:
@@ -326,8 +363,9 @@ def underline(text: str, escape_formatting: bool = True) -> str:
         The marked up text.
 
     """
-    text = escape(text, formatting=escape_formatting)
-    return "__{}__".format(text)
+    if escape_formatting:
+        text = _escape_markdown(text)
+    return _UNDERLINE + text + _UNDERLINE
 
 
 def quote(text: str) -> str:
@@ -344,7 +382,7 @@ def quote(text: str) -> str:
         The marked up text.
 
     """
-    return textwrap.indent(text, "> ", lambda l: True)
+    return "".join([_QUOTE + line for line in text.splitlines(True)])
 
 
 def escape(text: str, *, mass_mentions: bool = False, formatting: bool = False) -> str:
@@ -365,14 +403,22 @@ def escape(text: str, *, mass_mentions: bool = False, formatting: bool = False)
         The escaped text.
 
     """
-    if mass_mentions:
+    if not text:
+        return text
+    if mass_mentions and "@" in text:
         text = text.replace("@everyone", "@\u200beveryone")
         text = text.replace("@here", "@\u200bhere")
     if formatting:
-        text = discord.utils.escape_markdown(text)
+        text = _escape_markdown(text)
     return text
 
 
+@functools.lru_cache(maxsize=None)
+def _pair_pattern(style: str) -> str:
+    """Get the locale's pattern for joining exactly two items in the given style."""
+    return babel_list(["{0}", "{1}"], style=style)
+
+
 def humanize_list(
     items: Sequence[str], *, style: str = "standard"
 ) -> str:
@@ -429,7 +475,10 @@ def humanize_list(
         'omena, peruna tai aplari'
 
     """
-
+    if len(items) < 2:
+        return items[0] if items else ""
+    if len(items) == 2:
+        return _pair_pattern(style).format(*items)
     return babel_list(items, style=style)
 
 
@@ -454,9 +503,13 @@ def format_perms_list(perms: discord.Permissions) -> str:
     perm_names: List[str] = []
     for perm, value in perms:
         if value is True:
-            perm_name = '"' + perm.replace("_", " ").title() + '"'
+            perm_name = _PERM_NAME_CACHE.get(perm)
+            if perm_name is None:
+                perm_name = perm.replace("_", " ").title().replace("Guild", "Server")
+                perm_name = '"' + perm_name + '"'
+                _PERM_NAME_CACHE[perm] = perm_name
             perm_names.append(perm_name)
-    return humanize_list(perm_names).replace("Guild", "Server")
+    return humanize_list(perm_names)
 
 
 def humanize_timedelta(
@@ -499,29 +552,22 @@ def humanize_timedelta(
             "You must provide either a timedelta or a number of seconds")
 
     seconds = int(obj)
-    periods = [
-        (("year"), ("years"), 60 * 60 * 24 * 365),
-        (("month"), ("months"), 60 * 60 * 24 * 30),
-        (("day"), ("days"), 60 * 60 * 24),
-        (("hour"), ("hours"), 60 * 60),
-        (("minute"), ("minutes"), 60),
-        (("second"), ("seconds"), 1),
-    ]
 
     strings = []
-    for period_name, plural_period_name, period_seconds in periods:
+    for period_name, plural_period_name, period_seconds in _PERIODS:
         if seconds >= period_seconds:
-            period_value, seconds = divmod(seconds, period_seconds)
-            if period_value == 0:
-                continue
+            period_value = seconds // period_seconds
+            seconds %= period_seconds
             unit = plural_period_name if period_value > 1 else period_name
             strings.append(f"{period_value} {unit}")
+            if seconds == 0:
+                break
 
     return ", ".join(strings)
 
 
 def text_to_file(
-    text: str,
+    text: Union[str, bytes, bytearray, memoryview],
     filename: str = "file.txt",
     *,
     spoiler: bool = False,
@@ -534,8 +580,9 @@ def text_to_file(
 
     Parameters
     ----------
-    text: str
-        The text to put in your file.
+    text: Union[str, bytes, bytearray, memoryview]
+        The text to put in your file. Bytes-like objects are used as-is,
+        without being decoded and encoded again.
     filename: str
         The name of the file sent. Defaults to ``file.txt``.
     spoiler: bool
@@ -547,5 +594,11 @@ def text_to_file(
         The file containing your text.
 
     """
-    file = BytesIO(text.encode(encoding))
+    if isinstance(text, (bytes, bytearray, memoryview)):
+        data = text
+    else:
+        data = text.encode(encoding)
+    # BytesIO shares a bytes buffer until it is written to, so this doesn't
+    # copy the data a second time; other bytes-like objects are copied once
+    file = BytesIO(data)
     return discord.File(file, filename, spoiler=spoiler)